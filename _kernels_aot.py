@@ -0,0 +1,33 @@
+"""
+MCTP AOT kernels - Ahead-of-time build of the bootstrap kernel (requires numba)
+
+Run ``python -m mctp_theory._kernels_aot`` once after installing to write
+the compiled ``_kernels`` extension next to this file. pycc has no parallel
+backend, so CrossDomainValidator only prefers this serial build over the
+parallel JIT kernel in _numba_kernels when numba runs on a single thread
+(or numba itself is unavailable at runtime).
+
+numba.pycc is deprecated upstream and emits NumbaPendingDeprecationWarning
+(seen with numba 0.68); the build step may stop working in later releases.
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+from ._numba_kernels import resample_pearson
+
+cc = CC('_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export('bootstrap_pearson', 'f8[:](f8[:], f8[:], i8, i8)')
+def bootstrap_pearson(x, y, B, seed):
+    """Pearson r for B resamples, run serially over resample_pearson"""
+    out = np.empty(B)
+    for b in range(B):
+        out[b] = resample_pearson(x, y, (seed + b) & 0xFFFFFFFF)
+    return out
+
+if __name__ == "__main__":
+    cc.compile()
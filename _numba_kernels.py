@@ -0,0 +1,42 @@
+"""
+MCTP numba kernels - JIT-compiled bootstrap helpers (requires numba)
+"""
+
+import numpy as np
+from numba import njit, prange
+
+@njit
+def resample_pearson(x, y, seed):
+    """
+    Pearson r for one resample of (x, y) drawn from its own seed; NaN
+    when either resampled column is (numerically) constant
+    """
+    # Seeding per resample keeps the result independent of which thread
+    # runs it: numba keeps a separate RNG state per thread
+    np.random.seed(seed)
+    n = x.shape[0]
+    sx = sy = sxx = syy = sxy = 0.0
+    for _ in range(n):
+        j = np.random.randint(0, n)
+        xi = x[j]
+        yi = y[j]
+        sx += xi
+        sy += yi
+        sxx += xi * xi
+        syy += yi * yi
+        sxy += xi * yi
+    vx = n * sxx - sx * sx
+    vy = n * syy - sy * sy
+    # The one-pass variance of a constant column is rounding residue,
+    # which may even be negative; treat it as degenerate
+    if vx <= 1e-10 * n * sxx or vy <= 1e-10 * n * syy:
+        return np.nan
+    return (n * sxy - sx * sy) / np.sqrt(vx * vy)
+
+@njit(parallel=True)
+def bootstrap_pearson(x, y, B, seed):
+    """Pearson r for B resamples, accumulated without storing indices"""
+    out = np.empty(B)
+    for b in prange(B):
+        out[b] = resample_pearson(x, y, (seed + b) & 0xFFFFFFFF)
+    return out
@@ -3,44 +3,234 @@ MCTP Cross-Domain Validator - Tests theory across quantum, neural, cosmic domain
 """
 
 import numpy as np
-from scipy import stats
-from typing import Dict, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+@dataclass(frozen=True, slots=True)
+class QuantumResult:
+    """C_U estimate and correlation statistics from quantum processor data"""
+    C_U: float
+    correlation: float
+    correlation_uncertainty: Optional[float]  # None when no bootstrap ran
+    p_value: float
+    enhancement: float
+
+@dataclass(frozen=True, slots=True)
+class DomainPrediction:
+    """Predicted vs observed correlation for the neural or cosmic domain"""
+    predicted: float
+    observed: float
+    success: bool
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """Outcome of a full cross-domain validation"""
+    quantum: QuantumResult
+    neural: DomainPrediction
+    cosmic: DomainPrediction
+    overall_success: bool
+
+# Above this many resampled elements (n_bootstrap * n) the bootstrap is
+# streamed through the numba kernel instead of a (B, n) index matrix
+_NUMBA_MIN_ELEMENTS = 10_000_000
+
+# Resamples evaluated per block by the NumPy bootstrap
+_BOOTSTRAP_CHUNK = 512
+
+def _pearson_rows(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Closed-form Pearson r for each row of two (B, n) arrays (centred in
+    place); NaN for rows where either array is constant
+    """
+    # Constant rows are detected exactly, before centring: afterwards
+    # rounding residue can leave them a small nonzero norm and r = ±1
+    degenerate = ((xs == xs[:, :1]).all(axis=1) |
+                  (ys == ys[:, :1]).all(axis=1))
+    # Once each row is centred and scaled to unit length, r is the
+    # row-wise dot product, which einsum evaluates without temporaries
+    xs -= xs.mean(axis=1, keepdims=True)
+    ys -= ys.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        xs /= np.linalg.norm(xs, axis=1, keepdims=True)
+        ys /= np.linalg.norm(ys, axis=1, keepdims=True)
+    r = np.einsum('bi,bi->b', xs, ys)
+    r[degenerate] = np.nan
+    return r
+
+def _moments(r: np.ndarray) -> Tuple[int, float, float]:
+    """(count, mean, M2) of the finite values in r"""
+    # float64 explicitly: under NEP 50 float32 r minus a Python float
+    # stays float32, which would compute M2 in single precision
+    r = r[np.isfinite(r)].astype(np.float64)
+    if r.size == 0:
+        return 0, 0.0, 0.0
+    mean = float(r.mean())
+    d = r - mean
+    return r.size, mean, float(np.dot(d, d))
+
+def _merge_moments(a: Tuple[int, float, float],
+                   b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+    """Combine two (count, mean, M2) summaries (Welford/Chan update)"""
+    n_a, mean_a, M2_a = a
+    n_b, mean_b, M2_b = b
+    n = n_a + n_b
+    if n == 0:
+        return 0, 0.0, 0.0
+    delta = mean_b - mean_a
+    return (n, mean_a + delta * n_b / n,
+            M2_a + M2_b + delta * delta * n_a * n_b / n)
+
+def _bootstrap_numpy(x: np.ndarray, y: np.ndarray, B: int,
+                     rng: np.random.Generator) -> Tuple[int, float, float]:
+    """
+    Running (count, mean, M2) of Pearson r over B resamples, drawn in
+    fixed-size blocks; no B-sized array of r values is kept
+    """
+    # r only feeds a std reported to 3 decimals, so resamples are held in
+    # float32 with int32 indices; the merged moments are float64
+    x = x.astype(np.float32)
+    y = y.astype(np.float32)
+    n = x.shape[0]
+    chunk = max(1, min(_BOOTSTRAP_CHUNK, B))
+    xs_buf = np.empty((chunk, n), dtype=np.float32)
+    ys_buf = np.empty((chunk, n), dtype=np.float32)
+    moments = (0, 0.0, 0.0)
+    for start in range(0, B, chunk):
+        m = min(chunk, B - start)
+        idx = rng.integers(0, n, size=(m, n), dtype=np.int32)
+        xs = np.take(x, idx, out=xs_buf[:m])
+        ys = np.take(y, idx, out=ys_buf[:m])
+        moments = _merge_moments(moments, _moments(_pearson_rows(xs, ys)))
+    return moments
+
+def _bootstrap_chunk(x: np.ndarray, y: np.ndarray, B: int,
+                     seed: np.random.SeedSequence) -> Tuple[int, float, float]:
+    """Process-pool worker: (count, mean, M2) of r over B resamples"""
+    return _bootstrap_numpy(x, y, B, np.random.default_rng(seed))
+
+def _bootstrap_parallel(x: np.ndarray, y: np.ndarray, B: int,
+                        rng: np.random.Generator,
+                        n_jobs: int) -> Tuple[int, float, float]:
+    """Split B resamples across n_jobs worker processes"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Independent child streams, reproducible from the validator's rng
+    seeds = np.random.SeedSequence(int(rng.integers(2**63))).spawn(n_jobs)
+    sizes = [B // n_jobs + (i < B % n_jobs) for i in range(n_jobs)]
+    moments = (0, 0.0, 0.0)
+    # spawn, not the Linux default fork: forking after the parallel numba
+    # kernel has started its threading layer hangs at interpreter exit
+    with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context("spawn")) as pool:
+        for part in pool.map(_bootstrap_chunk, [x] * n_jobs, [y] * n_jobs,
+                             sizes, seeds):
+            moments = _merge_moments(moments, part)
+    return moments
+
+@lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    Bootstrap kernel, imported on first use: the parallel JIT kernel from
+    _numba_kernels, or the serial AOT-built _kernels extension when it
+    cannot lose (numba limited to one thread, or not importable); None
+    when neither is available
+    """
+    try:
+        import numba
+        from ._numba_kernels import bootstrap_pearson as jit_kernel
+    except ImportError:
+        jit_kernel = None
+    if jit_kernel is None or numba.get_num_threads() == 1:
+        try:
+            from ._kernels import bootstrap_pearson
+        except ImportError:
+            pass
+        else:
+            return bootstrap_pearson
+    return jit_kernel
 
 class CrossDomainValidator:
     """
     Validates MCTP predictions across three physical domains
     """
     
-    def __init__(self, random_seed: int = 42):
-        self.results = {}
-        np.random.seed(random_seed)
+    def __init__(self, random_seed: int = 42, n_bootstrap: int = 0,
+                 n_jobs: int = 1):
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be >= 1, got {n_jobs}")
+        self.results: Optional[ValidationResult] = None
+        self.random_seed = random_seed
+        self.n_bootstrap = n_bootstrap
+        self.n_jobs = n_jobs
+        self.rng = np.random.default_rng(random_seed)
+        # Formatted report and the results object it was built from
+        self._report_cache_key = None
+        self._report_cache = None
     
-    def quantum_estimation(self, symmetry_scores: np.ndarray, coherence_times: np.ndarray) -> Dict:
+    def quantum_estimation(self, symmetry_scores: np.ndarray, coherence_times: np.ndarray) -> QuantumResult:
         """
         Estimate universal constant C_U from quantum processor data
         """
-        # Calculate correlation
+        # scipy is imported here rather than at module level so that
+        # importing the package stays cheap for MCTP_Action-only users
+        from scipy import stats
+        
+        # Calculate correlation (the only pearsonr call; the bootstrap
+        # below needs r alone, not scipy's validation and p-value)
         r, p_value = stats.pearsonr(symmetry_scores, coherence_times)
         
+        # Bootstrap uncertainty on r (skipped when n_bootstrap is 0)
+        n = len(symmetry_scores)
+        if self.n_bootstrap <= 0:
+            moments = (0, 0.0, 0.0)
+        elif self.n_jobs > 1:
+            moments = _bootstrap_parallel(
+                np.asarray(symmetry_scores, dtype=np.float64),
+                np.asarray(coherence_times, dtype=np.float64),
+                self.n_bootstrap, self.rng, self.n_jobs)
+        elif (self.n_bootstrap * n >= _NUMBA_MIN_ELEMENTS and
+              (kernel := _numba_kernel()) is not None):
+            moments = _moments(kernel(
+                np.ascontiguousarray(symmetry_scores, dtype=np.float64),
+                np.ascontiguousarray(coherence_times, dtype=np.float64),
+                self.n_bootstrap, int(self.rng.integers(2**32))))
+        else:
+            moments = _bootstrap_numpy(
+                np.asarray(symmetry_scores, dtype=np.float64),
+                np.asarray(coherence_times, dtype=np.float64),
+                self.n_bootstrap, self.rng)
+        count, _, M2 = moments
+        if self.n_bootstrap <= 0:
+            r_uncertainty = None
+        else:
+            # Every resample degenerate: the spread is unknown, not zero
+            r_uncertainty = np.sqrt(M2 / count) if count > 0 else np.nan
+        
         # Calculate enhancement from symmetry
         high_symmetry = symmetry_scores > 0.7
         low_symmetry = symmetry_scores < 0.3
+        n_high = np.count_nonzero(high_symmetry)
+        n_low = np.count_nonzero(low_symmetry)
         
-        if np.sum(high_symmetry) > 0 and np.sum(low_symmetry) > 0:
-            enhancement = (np.mean(coherence_times[high_symmetry]) / 
-                         np.mean(coherence_times[low_symmetry]))
+        if n_high > 0 and n_low > 0:
+            enhancement = (coherence_times[high_symmetry].mean() /
+                           coherence_times[low_symmetry].mean())
         else:
             enhancement = 1.0
         
         # Estimate C_U (theoretical relationship)
         C_U_estimate = (enhancement - 1) ** 2
         
-        return {
-            'C_U': C_U_estimate,
-            'correlation': r,
-            'p_value': p_value,
-            'enhancement': enhancement
-        }
+        return QuantumResult(
+            C_U=C_U_estimate,
+            correlation=r,
+            correlation_uncertainty=r_uncertainty,
+            p_value=p_value,
+            enhancement=enhancement
+        )
     
     def predict_neural_correlation(self, C_U: float) -> float:
         """Predict neural transfer entropy correlation"""
@@ -50,7 +240,7 @@ class CrossDomainValidator:
         """Predict cosmic star formation correlation"""
         return 0.25 + 4.5 * C_U
     
-    def full_validation(self, quantum_data: Dict, neural_data: Dict, cosmic_data: Dict) -> Dict:
+    def full_validation(self, quantum_data: Dict, neural_data: Dict, cosmic_data: Dict) -> ValidationResult:
         """
         Complete cross-domain validation of MCTP theory
         """
@@ -61,38 +251,47 @@ class CrossDomainValidator:
         )
         
         # Step 2: Predict neural and cosmic correlations
-        neural_pred = self.predict_neural_correlation(quantum_result['C_U'])
-        cosmic_pred = self.predict_cosmic_correlation(quantum_result['C_U'])
+        neural_pred = self.predict_neural_correlation(quantum_result.C_U)
+        cosmic_pred = self.predict_cosmic_correlation(quantum_result.C_U)
         
         # Step 3: Compare predictions with observations
         neural_success = abs(neural_data['correlation'] - neural_pred) <= 0.1
         cosmic_success = abs(cosmic_data['correlation'] - cosmic_pred) <= 0.1
         
-        self.results = {
-            'quantum': quantum_result,
-            'neural': {
-                'predicted': neural_pred,
-                'observed': neural_data['correlation'],
-                'success': neural_success
-            },
-            'cosmic': {
-                'predicted': cosmic_pred, 
-                'observed': cosmic_data['correlation'],
-                'success': cosmic_success
-            },
-            'overall_success': neural_success and cosmic_success
-        }
+        self.results = ValidationResult(
+            quantum=quantum_result,
+            neural=DomainPrediction(
+                predicted=neural_pred,
+                observed=neural_data['correlation'],
+                success=neural_success
+            ),
+            cosmic=DomainPrediction(
+                predicted=cosmic_pred, 
+                observed=cosmic_data['correlation'],
+                success=cosmic_success
+            ),
+            overall_success=neural_success and cosmic_success
+        )
         
         return self.results
     
     def generate_report(self) -> str:
         """Generate validation report"""
-        if not self.results:
+        if self.results is None:
             return "No validation results available."
         
-        q = self.results['quantum']
-        n = self.results['neural']
-        c = self.results['cosmic']
+        # full_validation rebinds self.results and the result objects are
+        # frozen, so identity is enough to tell whether the cached report
+        # is still current
+        if self._report_cache_key is self.results:
+            return self._report_cache
+        
+        q = self.results.quantum
+        n = self.results.neural
+        c = self.results.cosmic
+        
+        uncertainty = ('' if q.correlation_uncertainty is None
+                       else f" ± {q.correlation_uncertainty:.3f}")
         
         report = f"""
 MCTP CROSS-DOMAIN VALIDATION REPORT
@@ -100,22 +299,24 @@ MCTP CROSS-DOMAIN VALIDATION REPORT
 
 QUANTUM DOMAIN:
 ---------------
-C_U Estimated: {q['C_U']:.3e}
-Correlation: {q['correlation']:.3f} (p = {q['p_value']:.3e})
-Coherence Enhancement: {q['enhancement']:.2f}x
+C_U Estimated: {q.C_U:.3e}
+Correlation: {q.correlation:.3f}{uncertainty} (p = {q.p_value:.3e})
+Coherence Enhancement: {q.enhancement:.2f}x
 
 NEURAL DOMAIN:
 --------------
-Predicted Correlation: {n['predicted']:.3f}
-Observed Correlation: {n['observed']:.3f}
-Prediction Success: {'✅' if n['success'] else '❌'}
+Predicted Correlation: {n.predicted:.3f}
+Observed Correlation: {n.observed:.3f}
+Prediction Success: {'✅' if n.success else '❌'}
 
 COSMIC DOMAIN:  
 --------------
-Predicted Correlation: {c['predicted']:.3f}
-Observed Correlation: {c['observed']:.3f}
-Prediction Success: {'✅' if c['success'] else '❌'}
+Predicted Correlation: {c.predicted:.3f}
+Observed Correlation: {c.observed:.3f}
+Prediction Success: {'✅' if c.success else '❌'}
 
-OVERALL VALIDATION: {'✅ SUCCESS' if self.results['overall_success'] else '❌ NEEDS REVISION'}
+OVERALL VALIDATION: {'✅ SUCCESS' if self.results.overall_success else '❌ NEEDS REVISION'}
 """
+        self._report_cache_key = self.results
+        self._report_cache = report
         return report
@@ -35,9 +35,10 @@ def main():
     
     # Show coherence scale predictions
     print("\n📏 Coherence Scale Predictions:")
-    for domain in ['quantum', 'neural', 'cosmic']:
-        constants = mctp.domain_specific_constants(domain)
-        scale = mctp.predict_coherence_scale(constants['E_b'])
+    domains = ['quantum', 'neural', 'cosmic']
+    scales = mctp.predict_coherence_scales(
+        [mctp.domain_specific_constants(domain)['E_b'] for domain in domains])
+    for domain, scale in zip(domains, scales):
         print(f"   {domain.capitalize()}: {scale:.2e} m")
     
     print("\n🎯 MCTP Framework Test Complete!")
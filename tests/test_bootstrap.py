@@ -0,0 +1,107 @@
+"""
+Tests for the bootstrap back-ends behind CrossDomainValidator.quantum_estimation
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+from mctp_theory.cross_domain_validator import (
+    CrossDomainValidator, _bootstrap_numpy, _merge_moments, _moments)
+
+def _sample(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.5, 0.8, size=n)
+    y = 100.0 + 100.0 * x + rng.normal(0.0, 5.0, size=n)
+    return x, y
+
+def test_numba_kernel_is_reproducible_across_threads():
+    numba = pytest.importorskip("numba")
+    from mctp_theory._numba_kernels import bootstrap_pearson
+    
+    if numba.config.NUMBA_NUM_THREADS < 2:
+        pytest.skip("needs NUMBA_NUM_THREADS > 1")
+    x, y = _sample()
+    first = bootstrap_pearson(x, y, 4000, 7)
+    second = bootstrap_pearson(x, y, 4000, 7)
+    np.testing.assert_array_equal(first, second)
+
+def test_numba_kernel_constant_input_is_not_infinite():
+    pytest.importorskip("numba")
+    from mctp_theory._numba_kernels import bootstrap_pearson
+    
+    x = np.full(20, 0.7)
+    _, y = _sample(20)
+    r = bootstrap_pearson(x, y, 50, 3)
+    assert np.isnan(r).all()
+    assert _moments(r) == (0, 0.0, 0.0)
+
+def _std(moments):
+    count, _, M2 = moments
+    return np.sqrt(M2 / count)
+
+def test_numpy_bootstrap_matches_corrcoef_loop():
+    x, y = _sample()
+    B = 500  # a single block, so the index draw below is the same one
+    idx = np.random.default_rng(11).integers(0, len(x), size=(B, len(x)),
+                                             dtype=np.int32)
+    expected = np.std([np.corrcoef(x[i], y[i])[0, 1] for i in idx])
+    
+    moments = _bootstrap_numpy(x, y, B, np.random.default_rng(11))
+    assert moments[0] == B
+    assert _std(moments) == pytest.approx(expected, rel=1e-4)
+
+def test_merge_moments_matches_var():
+    r = np.random.default_rng(5).normal(size=1001)
+    moments = (0, 0.0, 0.0)
+    for part in np.array_split(r, [1, 300, 301, 777]):
+        moments = _merge_moments(moments, _moments(part))
+    count, mean, M2 = moments
+    assert count == r.size
+    assert mean == pytest.approx(r.mean())
+    assert M2 / count == pytest.approx(np.var(r, ddof=0))
+
+def test_parallel_and_numba_agree_with_numpy():
+    x, y = _sample()
+    B = 20000
+    serial = _std(_bootstrap_numpy(x, y, B, np.random.default_rng(1)))
+    
+    validator = CrossDomainValidator(random_seed=1, n_bootstrap=B, n_jobs=2)
+    parallel = validator.quantum_estimation(x, y).correlation_uncertainty
+    assert parallel == pytest.approx(serial, rel=0.05)
+    
+    pytest.importorskip("numba")
+    from mctp_theory._numba_kernels import bootstrap_pearson
+    
+    jit = _std(_moments(bootstrap_pearson(x, y, B, 1)))
+    assert jit == pytest.approx(serial, rel=0.05)
+
+@pytest.mark.filterwarnings("ignore")  # scipy warns on constant input
+def test_all_degenerate_resamples_give_nan_uncertainty():
+    _, y = _sample(20)
+    validator = CrossDomainValidator(n_bootstrap=100)
+    result = validator.quantum_estimation(np.full(20, 0.7), y)
+    assert np.isnan(result.correlation_uncertainty)
+
+def test_rejects_non_positive_n_jobs():
+    with pytest.raises(ValueError):
+        CrossDomainValidator(n_jobs=-1)
+
+def test_process_pool_after_numba_kernel_exits():
+    pytest.importorskip("numba")
+    script = textwrap.dedent("""
+        import numpy as np
+        from mctp_theory._numba_kernels import bootstrap_pearson
+        from mctp_theory.cross_domain_validator import CrossDomainValidator
+        
+        x = np.linspace(0.5, 0.8, 50)
+        y = 100.0 + 100.0 * x + np.sin(np.arange(50))
+        bootstrap_pearson(x, y, 100, 0)
+        validator = CrossDomainValidator(n_bootstrap=2000, n_jobs=2)
+        validator.quantum_estimation(x, y)
+    """)
+    # A hang at interpreter shutdown surfaces as TimeoutExpired
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=120)